@@ -30,3 +30,4 @@ __version__ = "0.5.1"
 
 from .client import *
 from .exceptions import *
+from .transport import create_session as create_session
@@ -0,0 +1,157 @@
+"""
+MIT License
+
+Copyright (c) 2019 Lethys
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from .exceptions import XIVAPINotFound
+from .utils import JSON_HEADERS, canonical_csv, to_json
+
+
+if TYPE_CHECKING:
+    from .client import XIVAPIClient
+
+__all__ = ("IndexBatcher",)
+
+_BatchKey = Tuple[str, str, FrozenSet[str]]
+
+
+class IndexBatcher:
+    """
+    Coalesces index lookups by ID made within a short window into a single search request per index.
+    Parameters
+    ------------
+    client: XIVAPIClient
+        The client used to send the batched requests.
+    delay: float
+        How long to wait, in seconds, for further lookups before sending a batch. Defaults to 0.005.
+    max_batch_size: int
+        The maximum number of IDs to request in a single search. Defaults to 100.
+    """
+
+    __slots__ = (
+        "_client",
+        "_delay",
+        "_max_batch_size",
+        "_pending",
+        "_handle",
+        "_tasks",
+    )
+
+    def __init__(self, client: XIVAPIClient, *, delay: float = 0.005, max_batch_size: int = 100) -> None:
+        self._client: XIVAPIClient = client
+        self._delay: float = delay
+        self._max_batch_size: int = max_batch_size
+        self._pending: Dict[_BatchKey, Dict[int, List[asyncio.Future[Any]]]] = {}
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Future[None]] = set()
+
+    def load(self, index: str, content_id: int, columns: FrozenSet[str], language: str) -> asyncio.Future[Any]:
+        """
+        Queue a lookup and return a future that resolves to its result.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+
+        lookups = self._pending.setdefault((index, language, columns), {})
+        lookups.setdefault(int(content_id), []).append(future)
+
+        if self._handle is None:
+            self._handle = loop.call_later(self._delay, self._flush)
+
+        return future
+
+    def _flush(self) -> None:
+        self._handle = None
+        pending, self._pending = self._pending, {}
+
+        for key, lookups in pending.items():
+            content_ids = list(lookups)
+            for start in range(0, len(content_ids), self._max_batch_size):
+                batch = {content_id: lookups[content_id] for content_id in content_ids[start : start + self._max_batch_size]}
+                task = asyncio.ensure_future(self._dispatch(key, batch))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, key: _BatchKey, lookups: Dict[int, List[asyncio.Future[Any]]]) -> None:
+        index, language, columns = key
+
+        try:
+            if len(lookups) == 1:
+                # A lone lookup gains nothing from a search, so use the regular endpoint.
+                (content_id,) = lookups
+                result = await self._client._fetch_index_entry(index, content_id, columns, language)
+                _resolve(lookups[content_id], result)
+                return
+
+            body: Dict[str, Any] = {
+                "indexes": index,
+                # The ID column is needed to match each result back to its lookup.
+                "columns": canonical_csv(columns | {"ID"}),
+                "body": {
+                    "query": {"ids": {"values": list(lookups)}},
+                    "size": len(lookups),
+                },
+            }
+            params = self._client._language_params(language)
+            response = await self._client.handle_request(
+                "POST",
+                self._client._search_url,
+                params=params,
+                data=to_json(body),
+                headers=JSON_HEADERS,
+            )
+
+            found = {result.get("ID"): result for result in response.get("Results", [])}
+            for content_id, futures in lookups.items():
+                result = found.get(content_id)
+                if result is None:
+                    url = str(self._client._base_url / index / str(content_id))
+                    _reject(futures, XIVAPINotFound("Resource not found.", status=404, url=url))
+                else:
+                    _resolve(futures, result)
+
+        except Exception as exc:
+            for futures in lookups.values():
+                _reject(futures, exc)
+
+        finally:
+            for futures in lookups.values():
+                for future in futures:
+                    if not future.done():
+                        future.cancel()
+
+
+def _resolve(futures: List[asyncio.Future[Any]], result: Any) -> None:
+    for future in futures:
+        if not future.done():
+            future.set_result(result)
+
+
+def _reject(futures: List[asyncio.Future[Any]], exc: Exception) -> None:
+    for future in futures:
+        if not future.done():
+            future.set_exception(exc)
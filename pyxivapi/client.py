@@ -22,24 +22,62 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import asyncio
 import logging
-from typing import Any, ClassVar, List, Optional, TypeVar, Union
+from contextlib import asynccontextmanager
+from functools import lru_cache, partial
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import aiohttp
+import yarl
+from aiohttp.typedefs import StrOrURL
 
+from .batching import IndexBatcher
+from .cache import TTLCache
 from .decorators import timed
 from .exceptions import (
     XIVAPIBadRequest,
-    XIVAPIError,
     XIVAPIForbidden,
+    XIVAPIHTTPError,
     XIVAPIInvalidAlgo,
     XIVAPIInvalidColumns,
     XIVAPIInvalidIndex,
     XIVAPIInvalidLanguage,
     XIVAPINotFound,
     XIVAPIServiceUnavailable,
+    XIVAPITooManyRequests,
 )
 from .models import Filter, Sort
+from .transport import AiohttpTransport, HttpxResponse, HttpxTransport, Transport
+from .utils import (
+    JSON_HEADERS,
+    canonical_csv,
+    convert_model,
+    decode_model,
+    from_json,
+    parse_retry_after,
+    redact_url,
+    search_results_type,
+    to_json,
+)
 
 
 LOGGER = logging.getLogger(__name__)
@@ -48,6 +86,64 @@ __all__ = ("XIVAPIClient",)
 
 T = TypeVar("T")
 
+_MISSING: Any = object()
+
+# Every index_search matches the name against each language's combined name field with the same options.
+_NAME_FIELDS = ("NameCombined_en", "NameCombined_de", "NameCombined_fr", "NameCombined_ja")
+_NAME_MATCH_OPTIONS: Dict[str, Any] = {"fuzziness": "AUTO", "prefix_length": 1, "max_expansions": 50}
+
+# Placeholders for the per-call values in a pre-serialised index_search body.
+_NAME_SLOT_VALUE = "__NAME__"
+_PAGE_SLOT_VALUE = "__FROM__"
+_NAME_SLOT = to_json(_NAME_SLOT_VALUE)
+_PAGE_SLOT = to_json(_PAGE_SLOT_VALUE)
+
+# The error raised, and its message, for each status XIVAPI is known to respond with.
+_ERRORS: Dict[int, Tuple[Type[XIVAPIHTTPError], str]] = {
+    400: (XIVAPIBadRequest, "Request was bad. Please check your parameters."),
+    401: (XIVAPIForbidden, "Request was refused. Possibly due to an invalid API key."),
+    404: (XIVAPINotFound, "Resource not found."),
+    429: (XIVAPITooManyRequests, "Too many requests. The rate limit for this API key has been exceeded."),
+    500: (XIVAPIHTTPError, "An internal server error has occured on XIVAPI."),
+    503: (
+        XIVAPIServiceUnavailable,
+        "Service is unavailable. This could be because the Lodestone is under maintenance.",
+    ),
+}
+
+# Rate limited requests are not retried when XIVAPI asks for a longer wait than this, in seconds.
+_MAX_RETRY_AFTER = 60.0
+
+# Codes for the optional character_by_id data sets, in the same order as its include_* flags.
+_CHARACTER_DATA_CODES = ("AC", "MIMO", "FR", "CJ", "FC", "FCM", "PVP")
+
+
+def _request_key(
+    http_verb: str, request_url: StrOrURL, params: Mapping[str, Any], headers: Optional[Mapping[str, str]] = None
+) -> Hashable:
+    return (http_verb, request_url, tuple(sorted(params.items())), tuple(sorted(headers.items())) if headers else ())
+
+
+def _index_search_body(string_algo: str, indexes: str, columns: str, name: Any, page: Any, per_page: int) -> Dict[str, Any]:
+    return {
+        "indexes": indexes,
+        "columns": columns,
+        "body": {
+            "query": {
+                "bool": {
+                    "should": [{string_algo: {field: {"query": name, **_NAME_MATCH_OPTIONS}}} for field in _NAME_FIELDS],
+                }
+            },
+            "from": page,
+            "size": per_page,
+        },
+    }
+
+
+@lru_cache(maxsize=128)
+def _index_search_template(string_algo: str, indexes: str, columns: str, per_page: int) -> bytes:
+    return to_json(_index_search_body(string_algo, indexes, columns, _NAME_SLOT_VALUE, _PAGE_SLOT_VALUE, per_page))
+
 
 class XIVAPIClient:
     """
@@ -57,24 +153,66 @@ class XIVAPIClient:
     api_key: str
         The API key used for identifying your application with XIVAPI.com.
     session: Optional[ClientSession]
-        Optionally include your aiohttp session
+        Optionally include your aiohttp session.
+        If omitted, a pooled session with keep-alive enabled is created on the first request
+        and closed by :meth:`close`. A session you pass in is left open; :func:`create_session`
+        builds one with the same connection pooling and keep-alive tuning.
+    http2: bool
+        Whether to send requests over HTTP/2 with httpx instead of aiohttp. Defaults to False.
+        Concurrent requests are then multiplexed over a single connection.
+        Requires the ``httpx`` package, available through the ``http2`` extra, and cannot be combined with ``session``.
+    concurrency: int
+        The maximum number of requests this client will have in flight at once. Defaults to 16.
+        Any further requests wait for a free slot, so it is safe to ``asyncio.gather`` many calls at once.
+    batch_index_lookups: bool
+        Whether concurrent :meth:`index_by_id` calls should be coalesced into a single search request per index.
+        Defaults to False. When enabled, batched results always include the ID column.
+    cache_size: int
+        The maximum number of responses to keep from :meth:`character_by_id`, :meth:`freecompany_by_id`,
+        :meth:`index_by_id`, :meth:`lore_search` and :meth:`lodestone_worldstatus`. Defaults to 1024. Pass 0 to disable caching.
+        Cached responses are shared between callers, so they should not be mutated.
+    cache_ttl: float
+        How long, in seconds, a cached response remains valid. Defaults to 300.
+        Expired character and Free Company responses that came with an ETag are revalidated with ``If-None-Match``,
+        so an unchanged profile is not downloaded again.
+    max_retries: int
+        How many times a rate limited request is retried before :exc:`XIVAPITooManyRequests` is raised. Defaults to 3.
+        Each retry waits as long as the ``Retry-After`` header asks, or backs off exponentially when it is absent.
+    disable_timing: bool
+        Whether to skip timing and logging the duration of each endpoint call. Defaults to False.
+        This can also be changed later through the ``disable_timing`` attribute.
     """
 
     __slots__ = (
-        "api_key",
-        "_session",
-        "languages",
-        "string_algos",
+        "_api_key",
+        "_key_params",
+        "_params_by_language",
+        "_transport",
+        "_concurrency",
+        "_max_retries",
+        "disable_timing",
+        "_semaphore",
+        "_index_batcher",
+        "_cache",
+        "_inflight",
+        "_base_url",
+        "_character_url",
+        "_character_search_url",
+        "_freecompany_url",
+        "_freecompany_search_url",
+        "_linkshell_url",
+        "_linkshell_search_url",
+        "_pvpteam_url",
+        "_pvpteam_search_url",
+        "_search_url",
+        "_lore_url",
+        "_worldstatus_url",
     )
 
     base_url: ClassVar[str] = "https://xivapi.com"
-
-    def __init__(self, api_key: str, session: Optional[aiohttp.ClientSession] = None) -> None:
-        self.api_key: str = api_key
-        self._session: Optional[aiohttp.ClientSession] = session
-
-        self.languages: list[str] = ["en", "fr", "de", "ja"]
-        self.string_algos: list[str] = [
+    languages: ClassVar[FrozenSet[str]] = frozenset({"en", "fr", "de", "ja"})
+    string_algos: ClassVar[FrozenSet[str]] = frozenset(
+        {
             "custom",
             "wildcard",
             "wildcard_plus",
@@ -86,14 +224,231 @@ class XIVAPIClient:
             "match_phrase_prefix",
             "multi_match",
             "query_string",
-        ]
+        }
+    )
+
+    def __init__(
+        self,
+        api_key: str,
+        session: Optional[aiohttp.ClientSession] = None,
+        *,
+        http2: bool = False,
+        concurrency: int = 16,
+        batch_index_lookups: bool = False,
+        cache_size: int = 1024,
+        cache_ttl: float = 300.0,
+        max_retries: int = 3,
+        disable_timing: bool = False,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+
+        if max_retries < 0:
+            raise ValueError("max_retries cannot be negative.")
+
+        if http2 and session is not None:
+            raise ValueError("An aiohttp session cannot be used for HTTP/2 requests.")
+
+        self.api_key = api_key
+        self._transport: Transport = HttpxTransport() if http2 else AiohttpTransport(session)
+        self._concurrency: int = concurrency
+        self._max_retries: int = max_retries
+        self.disable_timing: bool = disable_timing
+        # Created lazily so that it binds to the running loop rather than whichever loop exists at construction.
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._index_batcher: Optional[IndexBatcher] = IndexBatcher(self) if batch_index_lookups else None
+        self._cache: Optional[TTLCache] = TTLCache(cache_size, cache_ttl) if cache_size > 0 else None
+        self._inflight: Dict[Hashable, asyncio.Future[Any]] = {}
+
+        # The endpoint URLs only depend on base_url, so parse them once rather than on every request.
+        # Appending a path segment to a parsed URL is then cheap, and aiohttp uses a yarl.URL as it is.
+        self._base_url: yarl.URL = yarl.URL(self.base_url)
+        base_url = self._base_url
+        self._character_url: yarl.URL = base_url / "character"
+        self._character_search_url: yarl.URL = self._character_url / "search"
+        self._freecompany_url: yarl.URL = base_url / "freecompany"
+        self._freecompany_search_url: yarl.URL = self._freecompany_url / "search"
+        self._linkshell_url: yarl.URL = base_url / "linkshell"
+        self._linkshell_search_url: yarl.URL = self._linkshell_url / "search"
+        self._pvpteam_url: yarl.URL = base_url / "pvpteam"
+        self._pvpteam_search_url: yarl.URL = self._pvpteam_url / "search"
+        self._search_url: yarl.URL = base_url / "search"
+        self._lore_url: yarl.URL = base_url / "lore"
+        self._worldstatus_url: yarl.URL = base_url / "lodestone" / "worldstatus"
+
+    @property
+    def api_key(self) -> str:
+        """The API key used for identifying your application with XIVAPI.com."""
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, api_key: str) -> None:
+        # Every request sends the key, and most send a language too, so their base params are built once here.
+        # These dicts are shared between requests, so they must be copied before anything is added to them.
+        self._api_key = api_key
+        self._key_params: Dict[str, str] = {"private_key": api_key}
+        self._params_by_language: Dict[str, Dict[str, str]] = {
+            language: {"private_key": api_key, "language": language} for language in self.languages
+        }
 
-    async def handle_request(self, http_verb: str, request_url: str, **kwargs: Any) -> aiohttp.ClientResponse:
-        if not self._session:
-            self._session = aiohttp.ClientSession()
+    def _language_params(self, language: str) -> Dict[str, str]:
+        try:
+            return self._params_by_language[language]
+        except KeyError:
+            # Not every endpoint validates its language, so anything else is passed on for XIVAPI to handle.
+            return {"private_key": self._api_key, "language": language}
 
-        async with self._session.request(http_verb.upper(), request_url, **kwargs) as response:
-            return response
+    async def __aenter__(self) -> "XIVAPIClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """|coro|
+        Close the underlying session, if it was created by this client.
+        """
+        await self._transport.close()
+
+    async def _cached(
+        self, key: Hashable, no_cache: bool, fetch: Callable[[], Awaitable[T]], ttl: Optional[float] = None
+    ) -> T:
+        if self._cache is None:
+            return await fetch()
+
+        if not no_cache:
+            cached = self._cache.get(key, _MISSING)
+            if cached is not _MISSING:
+                return cached
+
+        # process_response raises for anything other than a 200, so only successful responses are stored.
+        result = await fetch()
+        self._cache.set(key, result, ttl)
+        return result
+
+    async def _cached_revalidated(
+        self, request_url: StrOrURL, params: Dict[str, Any], model: Optional[Type[Any]], no_cache: bool, ttl: Optional[float]
+    ) -> Any:
+        if self._cache is None:
+            return await self.handle_request("GET", request_url, model=model, params=params)
+
+        key = (_request_key("GET", request_url, params), model)
+        kwargs: Dict[str, Any] = {"params": params}
+        stale: Optional[Tuple[str, Any]] = None
+
+        entry = None if no_cache else self._cache.get_entry(key)
+        if entry is not None:
+            fresh, (etag, result) = entry
+            if fresh:
+                return result
+
+            if etag is not None:
+                # XIVAPI then only has to confirm that the expired copy is still current, rather than send it again.
+                stale = (etag, result)
+                kwargs["headers"] = {"If-None-Match": etag}
+
+        process = partial(self._process_revalidated, model=model, stale=stale)
+        etag, result = await self._request("GET", request_url, process, ("revalidated", model), **kwargs)
+        self._cache.set(key, (etag, result), ttl)
+        return result
+
+    async def _process_revalidated(
+        self,
+        response: Union[aiohttp.ClientResponse, HttpxResponse],
+        model: Optional[Type[Any]],
+        stale: Optional[Tuple[str, Any]],
+    ) -> Tuple[Optional[str], Any]:
+        if response.status == 304 and stale is not None:
+            if LOGGER.isEnabledFor(logging.INFO):
+                LOGGER.info("304 from %s", redact_url(response.url))
+            return stale
+
+        result = await self.process_response(response, model)
+        return response.headers.get("ETag"), result
+
+    async def handle_request(
+        self, http_verb: str, request_url: StrOrURL, *, model: Optional[Type[Any]] = None, **kwargs: Any
+    ) -> Any:
+        return await self._request(http_verb, request_url, partial(self.process_response, model=model), model, **kwargs)
+
+    async def _request(
+        self, http_verb: str, request_url: StrOrURL, process: Callable[[Any], Awaitable[T]], tag: Hashable, **kwargs: Any
+    ) -> T:
+        http_verb = http_verb.upper()
+
+        params = kwargs.get("params")
+        headers = kwargs.get("headers")
+
+        # Only plain GETs are idempotent enough to share between concurrent callers.
+        # Params and headers must also be mappings to be keyed on; aiohttp's other forms,
+        # such as sequences of pairs or a query string, are sent without sharing.
+        if (
+            http_verb != "GET"
+            or kwargs.keys() - {"params", "headers"}
+            or not isinstance(params, (Mapping, type(None)))
+            or not isinstance(headers, (Mapping, type(None)))
+        ):
+            return await self._send_request(http_verb, request_url, process, **kwargs)
+
+        # The tag keeps callers that process the response differently from sharing a result.
+        key = (_request_key(http_verb, request_url, params or {}, headers), tag)
+        try:
+            task = self._inflight.get(key)
+        except TypeError:
+            # A param value that isn't hashable, e.g. a list for a repeated key.
+            return await self._send_request(http_verb, request_url, process, **kwargs)
+
+        if task is None:
+            task = asyncio.ensure_future(self._send_request(http_verb, request_url, process, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._inflight_done, key))
+
+        # Shielded so that one caller being cancelled does not cancel the request for everyone else waiting on it.
+        return await asyncio.shield(task)
+
+    def _inflight_done(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+        # Mark the exception as retrieved in case every waiter was cancelled before it was raised.
+        if not task.cancelled():
+            task.exception()
+
+    @asynccontextmanager
+    async def _open_response(
+        self, http_verb: str, request_url: StrOrURL, **kwargs: Any
+    ) -> AsyncIterator[Union[aiohttp.ClientResponse, HttpxResponse]]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+
+        async with self._semaphore:
+            async with self._transport.request(http_verb, request_url, **kwargs) as response:
+                yield response
+
+    async def _send_request(
+        self, http_verb: str, request_url: StrOrURL, process: Callable[[Any], Awaitable[T]], **kwargs: Any
+    ) -> T:
+        attempt = 0
+        while True:
+            try:
+                # The body must be consumed while the response is still held open,
+                # otherwise the connection is released back to the pool before it is read.
+                async with self._open_response(http_verb, request_url, **kwargs) as response:
+                    return await process(response)
+            except XIVAPITooManyRequests as exc:
+                delay = 2.0**attempt if exc.retry_after is None else exc.retry_after
+                if attempt >= self._max_retries or delay > _MAX_RETRY_AFTER:
+                    raise
+
+            # Wait outside of the concurrency slot, so that other requests are not held up behind this one.
+            LOGGER.info("Rate limited by XIVAPI, retrying in %.2fs", delay)
+            await asyncio.sleep(delay)
+            attempt += 1
 
     @timed
     async def character_search(self, world: str, forename: str, surname: str, page: int = 1) -> Any:
@@ -110,10 +465,15 @@ class XIVAPIClient:
         page: int
             The page of results to return. Defaults to 1.
         """
-        url = f"{self.base_url}/character/search?name={forename}%20{surname}&server={world}&page={page}&private_key={self.api_key}"
-        response = await self.handle_request("GET", url)
+        params: dict[str, Union[str, int]] = {
+            **self._key_params,
+            "name": f"{forename} {surname}",
+            "server": world,
+            "page": page,
+        }
 
-        return await self.process_response(response)
+        url = self._character_search_url
+        return await self.handle_request("GET", url, params=params)
 
     @timed
     async def character_by_id(
@@ -128,6 +488,9 @@ class XIVAPIClient:
         include_freecompany_members: bool = False,
         include_pvpteam: bool = False,
         language: str = "en",
+        *,
+        no_cache: bool = False,
+        cache_ttl: Optional[float] = None,
     ) -> Any:
         """|coro|
         Request character data from XIVAPI.com
@@ -136,44 +499,61 @@ class XIVAPIClient:
         ------------
         lodestone_id: int
             The character's Lodestone ID.
+        Optional[no_cache: bool]
+            Whether to bypass the response cache and always request fresh data. Defaults to False.
+        Optional[cache_ttl: float]
+            How long, in seconds, to cache this response for, instead of the client's ``cache_ttl``.
         """
 
-        params: dict[str, Union[str, int]] = {"private_key": self.api_key, "language": language}
-
-        if language.lower() not in self.languages:
+        lowered_language = language.lower()
+        if lowered_language not in self.languages:
             raise XIVAPIInvalidLanguage(f'"{language}" is not a valid language code for XIVAPI.')
 
+        params: dict[str, Union[str, int]] = {**self._params_by_language[lowered_language]}
+
         if extended is True:
             params["extended"] = 1
 
-        data = []
-        if include_achievements is True:
-            data.append("AC")
-
-        if include_minions_mounts is True:
-            data.append("MIMO")
-
-        if include_friendslist is True:
-            data.append("FR")
-
-        if include_classjobs is True:
-            data.append("CJ")
-
-        if include_freecompany is True:
-            data.append("FC")
-
-        if include_freecompany_members is True:
-            data.append("FCM")
+        flags = (
+            include_achievements,
+            include_minions_mounts,
+            include_friendslist,
+            include_classjobs,
+            include_freecompany,
+            include_freecompany_members,
+            include_pvpteam,
+        )
+        data = [code for code, enabled in zip(_CHARACTER_DATA_CODES, flags) if enabled is True]
+
+        if data:
+            params["data"] = ",".join(data)
 
-        if include_pvpteam is True:
-            data.append("PVP")
+        url = self._character_url / str(lodestone_id)
+        return await self._cached_revalidated(url, params, None, no_cache, cache_ttl)
 
-        if len(data) > 0:
-            params["data"] = ",".join(data)
+    @timed
+    async def character_by_ids(self, lodestone_ids: Iterable[int], **kwargs: Any) -> List[Any]:
+        """|coro|
+        Request data for several characters at once.
+        The requests are sent concurrently, up to the client's ``concurrency`` limit.
+        Parameters
+        ------------
+        lodestone_ids: Iterable[int]
+            The characters' Lodestone IDs.
+        **kwargs
+            Passed to :meth:`character_by_id` for every character.
+        Returns
+        ------------
+        list
+            The results in the same order as ``lodestone_ids``. Any exception a request raised, including connection
+            errors and timeouts as well as :exc:`XIVAPIHTTPError`, is returned in place of its result rather than raised.
+        """
+        if kwargs.get("language", "en").lower() not in self.languages:
+            raise XIVAPIInvalidLanguage(f'"{kwargs["language"]}" is not a valid language code for XIVAPI.')
 
-        url = f"{self.base_url}/character/{lodestone_id}"
-        response = await self.handle_request("GET", url)
-        return await self.process_response(response)
+        return await asyncio.gather(
+            *(self.character_by_id(lodestone_id, **kwargs) for lodestone_id in lodestone_ids), return_exceptions=True
+        )
 
     @timed
     async def freecompany_search(self, world: str, name: str, page: int = 1) -> Any:
@@ -188,10 +568,10 @@ class XIVAPIClient:
         page: int
             The page of results to return. Defaults to 1.
         """
-        url = f"{self.base_url}/freecompany/search?name={name}&server={world}&page={page}&private_key={self.api_key}"
-        response = await self.handle_request("GET", url)
+        params: dict[str, Union[str, int]] = {**self._key_params, "name": name, "server": world, "page": page}
 
-        return await self.process_response(response)
+        url = self._freecompany_search_url
+        return await self.handle_request("GET", url, params=params)
 
     @timed
     async def freecompany_by_id(
@@ -199,6 +579,9 @@ class XIVAPIClient:
         lodestone_id: int,
         extended: bool = False,
         include_freecompany_members: bool = False,
+        *,
+        no_cache: bool = False,
+        cache_ttl: Optional[float] = None,
     ) -> Any:
         """|coro|
         Request Free Company data from XIVAPI.com by Lodestone ID
@@ -207,9 +590,13 @@ class XIVAPIClient:
         ------------
         lodestone_id: int
             The Free Company's Lodestone ID.
+        Optional[no_cache: bool]
+            Whether to bypass the response cache and always request fresh data. Defaults to False.
+        Optional[cache_ttl: float]
+            How long, in seconds, to cache this response for, instead of the client's ``cache_ttl``.
         """
 
-        params: dict[str, Union[str, int]] = {"private_key": self.api_key}
+        params: dict[str, Union[str, int]] = {**self._key_params}
 
         if extended is True:
             params["extended"] = 1
@@ -218,13 +605,11 @@ class XIVAPIClient:
         if include_freecompany_members is True:
             data.append("FCM")
 
-        if len(data) > 0:
+        if data:
             params["data"] = ",".join(data)
 
-        url = f"{self.base_url}/freecompany/{lodestone_id}"
-        response = await self.handle_request("GET", url, params=params)
-
-        return await self.process_response(response)
+        url = self._freecompany_url / str(lodestone_id)
+        return await self._cached_revalidated(url, params, None, no_cache, cache_ttl)
 
     @timed
     async def linkshell_search(self, world: str, name: str, page: int = 1) -> Any:
@@ -239,10 +624,10 @@ class XIVAPIClient:
         page: int
             The page of results to return. Defaults to 1.
         """
-        url = f"{self.base_url}/linkshell/search?name={name}&server={world}&page={page}&private_key={self.api_key}"
-        response = await self.handle_request("GET", url)
+        params: dict[str, Union[str, int]] = {**self._key_params, "name": name, "server": world, "page": page}
 
-        return await self.process_response(response)
+        url = self._linkshell_search_url
+        return await self.handle_request("GET", url, params=params)
 
     @timed
     async def linkshell_by_id(self, lodestone_id: int) -> Any:
@@ -253,10 +638,10 @@ class XIVAPIClient:
         lodestone_id: int
             The Linkshell's Lodestone ID.
         """
-        url = f"{self.base_url}/linkshell/{lodestone_id}?private_key={self.api_key}"
-        response = await self.handle_request("GET", url)
+        params = self._key_params
 
-        return await self.process_response(response)
+        url = self._linkshell_url / str(lodestone_id)
+        return await self.handle_request("GET", url, params=params)
 
     @timed
     async def pvpteam_search(self, world: str, name: str, page: int = 1) -> Any:
@@ -271,10 +656,10 @@ class XIVAPIClient:
         page: int
             The page of results to return. Defaults to 1.
         """
-        url = f"{self.base_url}/pvpteam/search?name={name}&server={world}&page={page}&private_key={self.api_key}"
-        response = await self.handle_request("GET", url)
+        params: dict[str, Union[str, int]] = {**self._key_params, "name": name, "server": world, "page": page}
 
-        return await self.process_response(response)
+        url = self._pvpteam_search_url
+        return await self.handle_request("GET", url, params=params)
 
     @timed
     async def pvpteam_by_id(self, lodestone_id: int) -> None:
@@ -285,24 +670,25 @@ class XIVAPIClient:
         lodestone_id: str
             The PvPTeam's Lodestone ID.
         """
-        url = f"{self.base_url}/pvpteam/{lodestone_id}?private_key={self.api_key}"
-        response = await self.handle_request("GET", url)
+        params = self._key_params
 
-        return await self.process_response(response)
+        url = self._pvpteam_url / str(lodestone_id)
+        return await self.handle_request("GET", url, params=params)
 
     @timed
     async def index_search(
         self,
         *,
         name: str,
-        indexes: List[str] = [],
+        indexes: Optional[List[str]] = None,
         language: str = "en",
-        columns: List[str] = [],
-        filters: List[Filter] = [],
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Filter]] = None,
         sort: Optional[Sort] = None,
         page: int = 0,
         per_page: int = 10,
         string_algo: Optional[str] = "match",
+        model: Optional[Type[Any]] = None,
     ) -> Any:
         """|coro|
         Search for data from on specific indexes.
@@ -330,79 +716,108 @@ class XIVAPIClient:
             The search algorithm to use for string matching (default = "match")
             Valid values are "custom", "wildcard", "wildcard_plus", "fuzzy", "term", "prefix", "match", "match_phrase",
             "match_phrase_prefix", "multi_match", "query_string"
+        Optional[model: type]
+            A msgspec Struct (or any type msgspec supports) to decode each result into, instead of a dict.
+            The response is then returned as an object with ``Pagination`` and ``Results`` attributes.
+            Requires the ``msgspec`` package, available through the ``models`` extra.
         """
 
-        if len(indexes) == 0:
+        indexes = indexes or []
+        columns = columns or []
+        filters = filters or []
+        language, string_algo = self._validate_index_search(indexes, language, columns, string_algo)
+
+        data = self._index_search_data(name, indexes, columns, filters, sort, page, per_page, string_algo)
+        params = self._params_by_language[language]
+        response_model = search_results_type(model) if model is not None else None
+
+        url = self._search_url
+        return await self.handle_request("POST", url, model=response_model, params=params, data=data, headers=JSON_HEADERS)
+
+    async def index_search_iter(
+        self,
+        *,
+        name: str,
+        indexes: Optional[List[str]] = None,
+        language: str = "en",
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Filter]] = None,
+        sort: Optional[Sort] = None,
+        page: int = 0,
+        per_page: int = 10,
+        string_algo: Optional[str] = "match",
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Search for data from on specific indexes, yielding each result as it is parsed from the response.
+        This requires the ``ijson`` package, available through the ``stream`` extra.
+        Takes the same parameters as :meth:`index_search`.
+
+        The connection and a concurrency slot are held until the iterator is exhausted or closed.
+        """
+        indexes = indexes or []
+        columns = columns or []
+        filters = filters or []
+        language, string_algo = self._validate_index_search(indexes, language, columns, string_algo)
+
+        import ijson
+
+        data = self._index_search_data(name, indexes, columns, filters, sort, page, per_page, string_algo)
+        params = self._params_by_language[language]
+
+        url = self._search_url
+        async with self._open_response("POST", url, params=params, data=data, headers=JSON_HEADERS) as response:
+            if response.status != 200:
+                await self.process_response(response)
+                return
+
+            async for result in ijson.items(response.content, "Results.item", use_float=True):
+                yield result
+
+    def _validate_index_search(
+        self,
+        indexes: List[str],
+        language: str,
+        columns: List[str],
+        string_algo: Optional[str],
+    ) -> Tuple[str, str]:
+        # Plain function so that invalid arguments are rejected before any request work is done.
+        if not indexes:
             raise XIVAPIInvalidIndex('Please specify at least one index to search for, e.g. ["Recipe"]')
 
-        if language.lower() not in self.languages:
+        lowered_language = language.lower()
+        if lowered_language not in self.languages:
             raise XIVAPIInvalidLanguage(f'"{language}" is not a valid language code for XIVAPI.')
 
-        if len(columns) == 0:
+        if not columns:
             raise XIVAPIInvalidColumns("Please specify at least one column to return in the resulting data.")
 
-        if string_algo not in self.string_algos:
+        if string_algo is None or string_algo not in self.string_algos:
             raise XIVAPIInvalidAlgo(f'"{string_algo}" is not a supported string_algo for XIVAPI')
 
-        body: dict[str, Any] = {
-            "indexes": ",".join(list(set(indexes))),
-            "columns": "ID",
-            "body": {
-                "query": {
-                    "bool": {
-                        "should": [
-                            {
-                                string_algo: {
-                                    "NameCombined_en": {
-                                        "query": name,
-                                        "fuzziness": "AUTO",
-                                        "prefix_length": 1,
-                                        "max_expansions": 50,
-                                    }
-                                }
-                            },
-                            {
-                                string_algo: {
-                                    "NameCombined_de": {
-                                        "query": name,
-                                        "fuzziness": "AUTO",
-                                        "prefix_length": 1,
-                                        "max_expansions": 50,
-                                    }
-                                }
-                            },
-                            {
-                                string_algo: {
-                                    "NameCombined_fr": {
-                                        "query": name,
-                                        "fuzziness": "AUTO",
-                                        "prefix_length": 1,
-                                        "max_expansions": 50,
-                                    }
-                                }
-                            },
-                            {
-                                string_algo: {
-                                    "NameCombined_ja": {
-                                        "query": name,
-                                        "fuzziness": "AUTO",
-                                        "prefix_length": 1,
-                                        "max_expansions": 50,
-                                    }
-                                }
-                            },
-                        ]
-                    }
-                },
-                "from": page,
-                "size": per_page,
-            },
-        }
-
-        if len(columns) > 0:
-            body["columns"] = ",".join(list(set(columns)))
+        return lowered_language, string_algo
 
-        if len(filters) > 0:
+    def _index_search_data(
+        self,
+        name: str,
+        indexes: List[str],
+        columns: List[str],
+        filters: List[Filter],
+        sort: Optional[Sort],
+        page: int,
+        per_page: int,
+        string_algo: str,
+    ) -> bytes:
+        indexes_csv = canonical_csv(frozenset(indexes))
+        columns_csv = canonical_csv(frozenset(columns))
+
+        if not filters and sort is None:
+            # The common call shape only varies by name and page, so patch those into a pre-serialised template.
+            template = _index_search_template(string_algo, indexes_csv, columns_csv, per_page)
+            return template.replace(_PAGE_SLOT, to_json(page)).replace(_NAME_SLOT, to_json(name))
+
+        body = _index_search_body(string_algo, indexes_csv, columns_csv, name, page, per_page)
+
+        if filters:
             filts = []
             for f in filters:
                 filts.append({"range": {f.field: {f.comparison: f.value}}})
@@ -412,13 +827,20 @@ class XIVAPIClient:
         if sort:
             body["body"]["sort"] = [{sort.field: "asc" if sort.ascending else "desc"}]
 
-        url = f"{self.base_url}/search?language={language}&private_key={self.api_key}"
-        response = await self.handle_request("POST", url, json=body)
-
-        return await self.process_response(response)
+        return to_json(body)
 
     @timed
-    async def index_by_id(self, index, content_id: int, columns: List[str], language: str = "en") -> Any:
+    async def index_by_id(
+        self,
+        index: str,
+        content_id: int,
+        columns: List[str],
+        language: str = "en",
+        *,
+        model: Optional[Type[Any]] = None,
+        no_cache: bool = False,
+        cache_ttl: Optional[float] = None,
+    ) -> Any:
         """|coro|
         Request data from a given index by ID.
         Parameters
@@ -433,25 +855,109 @@ class XIVAPIClient:
         language: str
             The two character length language code that indicates the language to return the response in. Defaults to English (en).
             Valid values are "en", "fr", "de" & "ja"
+        Optional[model: type]
+            A msgspec Struct (or any type msgspec supports) to decode the response into, instead of a dict.
+            Requires the ``msgspec`` package, available through the ``models`` extra.
+        Optional[no_cache: bool]
+            Whether to bypass the response cache and always request fresh data. Defaults to False.
+        Optional[cache_ttl: float]
+            How long, in seconds, to cache this response for, instead of the client's ``cache_ttl``.
+        """
+        if index == "":
+            raise XIVAPIInvalidIndex('Please specify an index to search on, e.g. "Item"')
+
+        if not columns:
+            raise XIVAPIInvalidColumns("Please specify at least one column to return in the resulting data.")
+
+        column_set = frozenset(columns)
+        if self._index_batcher is not None:
+            fetch = partial(self._load_batched, self._index_batcher, index, content_id, column_set, language, model)
+        else:
+            fetch = partial(self._fetch_index_entry, index, content_id, column_set, language, model)
+
+        return await self._cached((index, content_id, column_set, language, model), no_cache, fetch, cache_ttl)
+
+    @timed
+    async def index_by_ids(
+        self,
+        index: str,
+        content_ids: Iterable[int],
+        columns: List[str],
+        language: str = "en",
+        *,
+        model: Optional[Type[Any]] = None,
+        no_cache: bool = False,
+        cache_ttl: Optional[float] = None,
+    ) -> List[Any]:
+        """|coro|
+        Request data for several IDs from a given index at once.
+        The lookups are sent concurrently, up to the client's ``concurrency`` limit, and are coalesced into
+        a single search request when ``batch_index_lookups`` is enabled.
+        Parameters
+        ------------
+        index: str
+            The index to which the content is attributed.
+        content_ids: Iterable[int]
+            The IDs of the content.
+        columns: list[str]
+            A named list of columns to return in the response, as with :meth:`index_by_id`.
+        language: str
+            The two character length language code that indicates the language to return the response in. Defaults to English (en).
+            Valid values are "en", "fr", "de" & "ja"
+        Optional[model: type]
+            A msgspec Struct (or any type msgspec supports) to decode each response into, instead of a dict.
+        Optional[no_cache: bool]
+            Whether to bypass the response cache and always request fresh data. Defaults to False.
+        Optional[cache_ttl: float]
+            How long, in seconds, to cache these responses for, instead of the client's ``cache_ttl``.
+        Returns
+        ------------
+        list
+            The results in the same order as ``content_ids``. Any exception a lookup raised, including connection
+            errors and timeouts as well as :exc:`XIVAPINotFound`, is returned in place of its result rather than raised.
         """
         if index == "":
             raise XIVAPIInvalidIndex('Please specify an index to search on, e.g. "Item"')
 
-        if len(columns) == 0:
+        if not columns:
             raise XIVAPIInvalidColumns("Please specify at least one column to return in the resulting data.")
 
-        params = {"private_key": self.api_key, "language": language}
+        return await asyncio.gather(
+            *(
+                self.index_by_id(index, content_id, columns, language, model=model, no_cache=no_cache, cache_ttl=cache_ttl)
+                for content_id in content_ids
+            ),
+            return_exceptions=True,
+        )
 
-        if len(columns) > 0:
-            params["columns"] = ",".join(list(set(columns)))
+    async def _load_batched(
+        self,
+        batcher: IndexBatcher,
+        index: str,
+        content_id: int,
+        columns: FrozenSet[str],
+        language: str,
+        model: Optional[Type[Any]],
+    ) -> Any:
+        result = await batcher.load(index, content_id, columns, language)
+        return result if model is None else convert_model(result, model)
 
-        url = f"{self.base_url}/{index}/{content_id}"
-        response = await self.handle_request("GET", url, params=params)
+    async def _fetch_index_entry(
+        self,
+        index: str,
+        content_id: int,
+        columns: FrozenSet[str],
+        language: str,
+        model: Optional[Type[Any]] = None,
+    ) -> Any:
+        # index_by_id has already rejected an empty set of columns.
+        params = {**self._language_params(language), "columns": canonical_csv(columns)}
 
-        return await self.process_response(response)
+        url = self._base_url / index / str(content_id)
+        return await self.handle_request("GET", url, model=model, params=params)
 
     @timed
-    async def lore_search(self, query: str, language: str = "en") -> Any:
+    async def lore_search(self, query: str, language: str = "en", *, no_cache: bool = False) -> Any:
         """|coro|
         Search cutscene subtitles, quest dialog, item, achievement, mount & minion descriptions and more for any text that matches query.
         Parameters
@@ -461,42 +967,47 @@ class XIVAPIClient:
         Optional[language: str]
             The two character length language code that indicates the language to return the response in. Defaults to English (en).
             Valid values are "en", "fr", "de" & "ja"
+        Optional[no_cache: bool]
+            Whether to bypass the response cache and always request fresh data. Defaults to False.
         """
-        params = {"private_key": self.api_key, "language": language, "string": query}
-
-        url = f"{self.base_url}/lore"
-        response = await self.handle_request("GET", url, params=params)
+        params = {**self._language_params(language), "string": query}
 
-        return await self.process_response(response)
+        url = self._lore_url
+        fetch = partial(self.handle_request, "GET", url, params=params)
+        return await self._cached(_request_key("GET", url, params), no_cache, fetch)
 
     @timed
-    async def lodestone_worldstatus(self) -> Any:
+    async def lodestone_worldstatus(self, *, no_cache: bool = False) -> Any:
         """|coro|
         Request world status post from the Lodestone.
+        Parameters
+        ------------
+        Optional[no_cache: bool]
+            Whether to bypass the response cache and always request fresh data. Defaults to False.
         """
-        url = f"{self.base_url}/lodestone/worldstatus?private_key={self.api_key}"
-        response = await self.handle_request("GET", url)
-        return await self.process_response(response)
-
-    async def process_response(self, response: aiohttp.ClientResponse) -> Any:
-        LOGGER.info(f"{response.status} from {response.url}")
+        params = self._key_params
 
-        if response.status == 200:
-            return await response.json()
+        url = self._worldstatus_url
+        fetch = partial(self.handle_request, "GET", url, params=params)
+        return await self._cached(_request_key("GET", url, params), no_cache, fetch)
 
-        elif response.status == 400:
-            raise XIVAPIBadRequest("Request was bad. Please check your parameters.")
+    async def process_response(
+        self, response: Union[aiohttp.ClientResponse, HttpxResponse], model: Optional[Type[Any]] = None
+    ) -> Any:
+        status = response.status
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info("%s from %s", status, redact_url(response.url))
 
-        elif response.status == 401:
-            raise XIVAPIForbidden("Request was refused. Possibly due to an invalid API key.")
+        if status == 200:
+            data = await response.read()
+            return from_json(data) if model is None else decode_model(data, model)
 
-        elif response.status == 404:
-            raise XIVAPINotFound("Resource not found.")
+        url = redact_url(response.url)
 
-        elif response.status == 500:
-            raise XIVAPIError("An internal server error has occured on XIVAPI.")
+        if status == 429:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            raise XIVAPITooManyRequests(_ERRORS[429][1], status=429, url=url, retry_after=retry_after)
 
-        elif response.status == 503:
-            raise XIVAPIServiceUnavailable(
-                "Service is unavailable. This could be because the Lodestone is under maintenance."
-            )
+        # Anything that isn't a 200 is an error, including statuses XIVAPI isn't known to respond with.
+        exc_cls, message = _ERRORS.get(status, (XIVAPIHTTPError, f"Unexpected status {status} from XIVAPI."))
+        raise exc_cls(message, status=status, url=url)
@@ -26,7 +26,7 @@ from __future__ import annotations
 
 import logging
 from functools import wraps
-from time import time
+from time import perf_counter_ns
 from typing import TYPE_CHECKING, Any, Callable, Coroutine, TypeVar
 
 
@@ -44,13 +44,18 @@ LOGGER = logging.getLogger(__name__)
 
 
 def timed(func: Callable[P, Coroutine[Any, Any, T]]) -> Callable[P, Coroutine[Any, Any, T]]:
-    """This decorator prints the execution time for the decorated function."""
+    """This decorator logs the execution time for the decorated function.
+    Timing is skipped when INFO logging is disabled or the instance sets ``disable_timing``.
+    """
 
     @wraps(func)
     async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        start = time()
+        if not LOGGER.isEnabledFor(logging.INFO) or getattr(args[0] if args else None, "disable_timing", False):
+            return await func(*args, **kwargs)
+
+        start = perf_counter_ns()
         result = await func(*args, **kwargs)
-        LOGGER.info("{} executed in {}s".format(func.__name__, round(time() - start, 2)))
+        LOGGER.info("%s executed in %.2fs", func.__name__, (perf_counter_ns() - start) / 1e9)
         return result
 
     return wrapper
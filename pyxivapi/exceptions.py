@@ -22,11 +22,16 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from typing import Optional
+
+
 __all__ = (
+    "XIVAPIHTTPError",
     "XIVAPIForbidden",
     "XIVAPIBadRequest",
     "XIVAPINotFound",
     "XIVAPIServiceUnavailable",
+    "XIVAPITooManyRequests",
     "XIVAPIInvalidLanguage",
     "XIVAPIInvalidIndex",
     "XIVAPIInvalidColumns",
@@ -38,7 +43,37 @@ __all__ = (
 )
 
 
-class XIVAPIForbidden(Exception):
+class XIVAPIError(Exception):
+    """
+    XIVAPI error
+    """
+
+    pass
+
+
+class XIVAPIHTTPError(XIVAPIError):
+    """
+    XIVAPI HTTP error, raised when XIVAPI responds with an error status
+    Attributes
+    ------------
+    status: Optional[int]
+        The HTTP status code of the response, if known.
+    url: Optional[str]
+        The requested URL, with the API key removed, if known.
+    """
+
+    def __init__(self, message: Optional[str] = None, *, status: Optional[int] = None, url: Optional[str] = None) -> None:
+        self.status: Optional[int] = status
+        self.url: Optional[str] = url
+
+        if message is None and status is not None:
+            message = f"XIVAPI responded with status {status}."
+
+        # Passing no arguments keeps a bare XIVAPIHTTPError() identical to a bare Exception().
+        super().__init__(*(() if message is None else (message,)))
+
+
+class XIVAPIForbidden(XIVAPIHTTPError):
     """
     XIVAPI Forbidden Request error
     """
@@ -46,7 +81,7 @@ class XIVAPIForbidden(Exception):
     pass
 
 
-class XIVAPIBadRequest(Exception):
+class XIVAPIBadRequest(XIVAPIHTTPError):
     """
     XIVAPI Bad Request error
     """
@@ -54,7 +89,7 @@ class XIVAPIBadRequest(Exception):
     pass
 
 
-class XIVAPINotFound(Exception):
+class XIVAPINotFound(XIVAPIHTTPError):
     """
     XIVAPI not found error
     """
@@ -62,7 +97,7 @@ class XIVAPINotFound(Exception):
     pass
 
 
-class XIVAPIServiceUnavailable(Exception):
+class XIVAPIServiceUnavailable(XIVAPIHTTPError):
     """
     XIVAPI service unavailable error
     """
@@ -70,6 +105,27 @@ class XIVAPIServiceUnavailable(Exception):
     pass
 
 
+class XIVAPITooManyRequests(XIVAPIHTTPError):
+    """
+    XIVAPI rate limit error, raised once retrying a rate limited request has been exhausted
+    Attributes
+    ------------
+    retry_after: Optional[float]
+        How long, in seconds, XIVAPI asked to wait before retrying, if it said.
+    """
+
+    def __init__(
+        self,
+        message: Optional[str] = None,
+        *,
+        status: Optional[int] = None,
+        url: Optional[str] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        self.retry_after: Optional[float] = retry_after
+        super().__init__(message, status=status, url=url)
+
+
 class XIVAPIInvalidLanguage(Exception):
     """
     XIVAPI invalid language error
@@ -118,14 +174,6 @@ class XIVAPIInvalidDatacenter(Exception):
     pass
 
 
-class XIVAPIError(Exception):
-    """
-    XIVAPI error
-    """
-
-    pass
-
-
 class XIVAPIInvalidAlgo(Exception):
     """
     Invalid String Algo
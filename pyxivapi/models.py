@@ -22,12 +22,29 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from typing import ClassVar, List
+from dataclasses import dataclass
+from typing import Any, ClassVar, FrozenSet, Tuple
 
 from .exceptions import XIVAPIInvalidFilter
 
 
-class Filter:
+class _FrozenSlots:
+    # dataclass(slots=True) needs Python 3.10, so the slots are declared by hand.
+    # That also means adding the pickling support it would have added, since copy and pickle
+    # otherwise restore slots with setattr, which a frozen dataclass refuses.
+
+    __slots__ = ()
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class Filter(_FrozenSlots):
     """
     Model class for DQL filters
     """
@@ -38,20 +55,23 @@ class Filter:
         "value",
     )
 
-    comparisons: ClassVar[List[str]] = ["gt", "gte", "lt", "lte"]
+    comparisons: ClassVar[FrozenSet[str]] = frozenset({"gt", "gte", "lt", "lte"})
+
+    field: str
+    comparison: str
+    value: int
 
-    def __init__(self, field: str, comparison: str, value: int) -> None:
-        comparison = comparison.lower()
+    def __post_init__(self) -> None:
+        comparison = self.comparison.lower()
 
         if comparison not in self.comparisons:
             raise XIVAPIInvalidFilter(f'"{comparison}" is not a valid DQL filter comparison.')
 
-        self.field: str = field
-        self.comparison: str = comparison
-        self.value: int = value
+        object.__setattr__(self, "comparison", comparison)
 
 
-class Sort:
+@dataclass(frozen=True)
+class Sort(_FrozenSlots):
     """
     Model class for sort field
     """
@@ -61,6 +81,5 @@ class Sort:
         "ascending",
     )
 
-    def __init__(self, field: str, ascending: bool) -> None:
-        self.field: str = field
-        self.ascending: bool = ascending
+    field: str
+    ascending: bool
@@ -0,0 +1,217 @@
+"""
+MIT License
+
+Copyright (c) 2019 Lethys
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional, Union
+
+import aiohttp
+import yarl
+from aiohttp import hdrs
+from aiohttp.typedefs import StrOrURL
+
+from . import __version__
+
+
+if TYPE_CHECKING:
+    import httpx
+
+__all__ = (
+    "AiohttpTransport",
+    "HttpxResponse",
+    "HttpxTransport",
+    "Transport",
+    "create_session",
+)
+
+USER_AGENT = f"pyxivapi/{__version__} (https://github.com/xivapi/xivapi-py)"
+
+_AIOHTTP_HEADERS = {"User-Agent": f"{USER_AGENT} aiohttp/{aiohttp.__version__}"}
+# Search responses are large and repetitive JSON, which brotli compresses far better than gzip.
+# Newer aiohttp versions already ask for it, along with any other encoding they can decode, when a decoder is installed.
+# Older ones decompress it with the brotli package but leave it out of their default, so only then is it added here.
+_DEFAULT_ACCEPT_ENCODING: str = aiohttp.ClientRequest.DEFAULT_HEADERS.get(hdrs.ACCEPT_ENCODING, "gzip, deflate")
+if "br" not in (encoding.strip() for encoding in _DEFAULT_ACCEPT_ENCODING.split(",")) and find_spec("brotli") is not None:
+    _AIOHTTP_HEADERS[hdrs.ACCEPT_ENCODING] = f"{_DEFAULT_ACCEPT_ENCODING}, br"
+
+
+def create_session(**kwargs: Any) -> aiohttp.ClientSession:
+    """
+    Create an aiohttp ClientSession tuned for XIVAPI, the same way the client does when it isn't given one.
+    Connections to xivapi.com are pooled and kept alive for 75 seconds, so bursts of requests
+    spaced further apart than aiohttp's default 15 second keep-alive don't repeat the TLS handshake.
+    This must be called from within a coroutine, and the caller is responsible for closing the session.
+    Parameters
+    ------------
+    **kwargs
+        Passed to :class:`aiohttp.ClientSession`, overriding the defaults.
+    """
+    if "connector" not in kwargs:
+        kwargs["connector"] = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+        )
+    kwargs.setdefault("timeout", aiohttp.ClientTimeout(total=30))
+    kwargs.setdefault("headers", _AIOHTTP_HEADERS)
+    return aiohttp.ClientSession(**kwargs)
+
+
+class AiohttpTransport:
+    """
+    Sends requests over HTTP/1.1 through an aiohttp ClientSession.
+    Parameters
+    ------------
+    session: Optional[ClientSession]
+        The session to send requests with. If omitted, a pooled session with keep-alive enabled
+        is created on the first request and closed by :meth:`close`.
+    """
+
+    __slots__ = (
+        "_session",
+        "_owns_session",
+    )
+
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None) -> None:
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session: bool = session is None
+
+    @asynccontextmanager
+    async def request(self, http_verb: str, request_url: StrOrURL, **kwargs: Any) -> AsyncIterator[aiohttp.ClientResponse]:
+        if self._session is None:
+            # Created here rather than in __init__ so that the session binds to the running loop.
+            self._session = create_session()
+
+        async with self._session.request(http_verb, request_url, **kwargs) as response:
+            yield response
+
+    async def close(self) -> None:
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+            self._session = None
+
+
+class _HttpxStream:
+    # Gives an httpx response body the ``async read(n)`` interface of aiohttp's StreamReader.
+
+    __slots__ = (
+        "_chunks",
+        "_buffer",
+    )
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._chunks: AsyncIterator[bytes] = response.aiter_bytes()
+        self._buffer: bytes = b""
+
+    async def read(self, n: int = -1) -> bytes:
+        while n < 0 or len(self._buffer) < n:
+            try:
+                self._buffer += await self._chunks.__anext__()
+            except StopAsyncIteration:
+                break
+
+        if n < 0:
+            n = len(self._buffer)
+
+        data, self._buffer = self._buffer[:n], self._buffer[n:]
+        return data
+
+
+class HttpxResponse:
+    """
+    Exposes an httpx Response through the attributes of aiohttp's ClientResponse that the client relies on.
+    """
+
+    __slots__ = (
+        "_response",
+        "status",
+        "url",
+        "headers",
+        "content",
+    )
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._response: httpx.Response = response
+        self.status: int = response.status_code
+        self.url: yarl.URL = yarl.URL(str(response.url))
+        self.headers: httpx.Headers = response.headers
+        self.content: _HttpxStream = _HttpxStream(response)
+
+    async def read(self) -> bytes:
+        return await self._response.aread()
+
+
+class HttpxTransport:
+    """
+    Sends requests over HTTP/2 through an httpx AsyncClient, multiplexing concurrent requests over one connection.
+    This requires the ``httpx`` package with HTTP/2 support, available through the ``http2`` extra.
+    """
+
+    __slots__ = ("_client",)
+
+    def __init__(self) -> None:
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _create_client(self) -> httpx.AsyncClient:
+        import httpx
+
+        # Matches the aiohttp connector's pool size and keep-alive; httpx would otherwise drop idle connections after 5s.
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=75.0)
+        # httpx negotiates brotli by itself when a decoder is installed.
+        return httpx.AsyncClient(
+            http2=True,
+            limits=limits,
+            timeout=30.0,
+            headers={"User-Agent": f"{USER_AGENT} httpx/{httpx.__version__}"},
+        )
+
+    @asynccontextmanager
+    async def request(
+        self,
+        http_verb: str,
+        request_url: StrOrURL,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncIterator[HttpxResponse]:
+        if self._client is None:
+            self._client = self._create_client()
+
+        # httpx has its own URL type, so a yarl.URL has to go back through a string.
+        url = str(request_url)
+        async with self._client.stream(http_verb, url, params=params, content=data, headers=headers) as response:
+            yield HttpxResponse(response)
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+Transport = Union[AiohttpTransport, HttpxTransport]
@@ -0,0 +1,125 @@
+"""
+MIT License
+
+Copyright (c) 2019 Lethys
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import time
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Type
+
+import yarl
+
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+__all__ = (
+    "JSON_HEADERS",
+    "canonical_csv",
+    "convert_model",
+    "decode_model",
+    "from_json",
+    "parse_retry_after",
+    "redact_url",
+    "search_results_type",
+    "to_json",
+)
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@lru_cache(maxsize=256)
+def canonical_csv(values: FrozenSet[str]) -> str:
+    """Join a set of values into a sorted, comma separated string so that equivalent requests are identical."""
+    return ",".join(sorted(values))
+
+
+def redact_url(url: yarl.URL) -> str:
+    """Render a request URL without the API key, so that it is safe to surface in errors."""
+    return str(url.with_query([(key, value) for key, value in url.query.items() if key != "private_key"]))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Read a ``Retry-After`` header, given either as seconds or as an HTTP date, into a delay in seconds."""
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+if HAS_ORJSON:
+
+    def to_json(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def from_json(data: bytes) -> Any:
+        return orjson.loads(data)
+
+else:
+
+    def to_json(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def from_json(data: bytes) -> Any:
+        return json.loads(data)
+
+
+def _import_msgspec() -> Any:
+    # msgspec needs Python 3.8+, so the models extra leaves it out on 3.7.
+    # Importing it by name keeps type checkers on 3.7 from requiring it, while still raising ModuleNotFoundError.
+    return importlib.import_module("msgspec")
+
+
+def decode_model(data: bytes, model: Type[Any]) -> Any:
+    """Decode a JSON body straight into ``model`` using msgspec."""
+    msgspec = _import_msgspec()
+    return msgspec.json.decode(data, type=model)
+
+
+def convert_model(obj: Any, model: Type[Any]) -> Any:
+    """Convert already decoded JSON into ``model`` using msgspec."""
+    msgspec = _import_msgspec()
+    return msgspec.convert(obj, type=model)
+
+
+@lru_cache(maxsize=None)
+def search_results_type(model: Type[Any]) -> Type[Any]:
+    """Build the struct that an index search response is decoded into when its results use ``model``."""
+    msgspec = _import_msgspec()
+    return msgspec.defstruct("SearchResults", [("Pagination", Dict[str, Any]), ("Results", List[model])])
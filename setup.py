@@ -25,6 +25,12 @@ setuptools.setup(
     keywords='ffxiv xivapi',
     include_package_data=True,
     install_requires=REQUIREMENTS,
+    extras_require={
+        'speed': ['orjson>=3.0', 'Brotli'],
+        'stream': ['ijson>=3.1'],
+        'models': ['msgspec>=0.15; python_version >= "3.8"'],
+        'http2': ['httpx[http2]>=0.18'],
+    },
     classifiers=[
         'License :: OSI Approved :: MIT License',
         'Intended Audience :: Developers',